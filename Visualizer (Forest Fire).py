@@ -3,47 +3,105 @@
 import sys
 import os
 import json
-import requests
+import time
+STARTUP_T0 = time.perf_counter()  # see TERRA_STARTUP_TRACE
+import atexit
+import ctypes
+import hashlib
+import mimetypes
+import shutil
+import threading
+import bisect
+from collections import deque
 import re
-from io import BytesIO
-from PIL import Image
-import cv2
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QPushButton, QLabel, QComboBox, QOpenGLWidget
+    QTextEdit, QPushButton, QLabel, QComboBox, QOpenGLWidget, QSizePolicy
 )
-from PyQt5.QtGui import QPixmap, QTextCursor, QTextCharFormat, QColor
-from PyQt5.QtCore import Qt, QTimer
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QTextCursor, QTextCharFormat, QColor
+from PyQt5.QtCore import Qt, QTimer, QObject, QEvent, pyqtSignal
+# cv2, requests and PyOpenGL are imported where they are first needed (the
+# decoder thread, the first download, the globe's GL context), not at startup
+GL = GLU = None
 
 # ----------------------------
-# Helper: download files
+# Asset cache settings
+# (override with environment variables on the kiosks)
 # ----------------------------
-def download_file(url, local_path, timeout=30):
-    """Download url to local_path using requests. Return True on success."""
-    try:
-        r = requests.get(url, stream=True, timeout=timeout)
-        r.raise_for_status()
-        with open(local_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-        return True
-    except Exception as e:
-        print("Download error:", e, url)
-        return False
+ASSET_CACHE_DIR = os.environ.get(
+    "TERRA_ASSET_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "terra_visualizer"))
+ASSET_CACHE_MAX_MB = int(os.environ.get("TERRA_ASSET_CACHE_MB", "2048"))
+# seconds a cached file is trusted before we revalidate it with ETag/Last-Modified
+ASSET_REVALIDATE_AFTER = int(os.environ.get("TERRA_ASSET_REVALIDATE_S", str(24 * 3600)))
+# seconds cache-hit access times may sit in memory before index.json is rewritten
+ASSET_INDEX_FLUSH_S = 30
+# parallel downloads per incident (also the size of the HTTP keep-alive pool)
+LOADER_WORKERS = int(os.environ.get("TERRA_LOADER_WORKERS", "6"))
 
-def download_image_to_pixmap(url):
-    try:
-        r = requests.get(url, timeout=20)
-        r.raise_for_status()
-        pix = QPixmap()
-        pix.loadFromData(r.content)
-        return pix
-    except Exception as e:
-        print("Image download failed:", e, url)
+# ----------------------------
+# Globe video playback settings
+# ----------------------------
+# the globe plays event videos slowed down (this used to be a "read every 4th tick" divisor)
+VIDEO_PLAYBACK_RATE = 0.25
+# decoded frames kept ready ahead of the paint path
+VIDEO_BUFFER_FRAMES = 8
+# bytes of a downloading video to wait for before trying to play it (and between retries)
+STREAM_START_BYTES = 1024 * 1024
+# stream frames through two pixel buffer objects (set TERRA_NO_PBO=1 on drivers that misbehave)
+TEXTURE_USE_PBO = os.environ.get("TERRA_NO_PBO", "") != "1"
+# sphere tessellation (stacks = slices); 0 picks a level of detail from the zoom
+SPHERE_SEGMENTS = int(os.environ.get("TERRA_SPHERE_SEGMENTS", "0"))
+
+# ----------------------------
+# Redraw scheduling
+# ----------------------------
+# auto-rotation speed (the old 0.03 degrees per 40 ms tick)
+ROTATE_DEG_PER_S = 0.75
+# rotation alone only needs a few repaints a second to look smooth at this speed
+ROTATION_FPS = float(os.environ.get("TERRA_ROTATION_FPS", "20"))
+# how often a paused (minimized/hidden) window checks whether it is visible again
+PAUSED_POLL_MS = 250
+# draw an FPS / frame-time overlay on the globe
+SHOW_FPS = os.environ.get("TERRA_SHOW_FPS", "") == "1"
+
+# ----------------------------
+# Startup
+# ----------------------------
+# print how long each startup step took, from process start
+STARTUP_TRACE = os.environ.get("TERRA_STARTUP_TRACE", "") == "1"
+
+def startup_mark(what):
+    if STARTUP_TRACE:
+        print(f"[startup] {(time.perf_counter() - STARTUP_T0) * 1000:8.1f} ms  {what}", flush=True)
+
+def load_gl():
+    """Import PyOpenGL (slow) the first time a GL context needs it."""
+    global GL, GLU
+    if GL is None:
+        from OpenGL import GL, GLU
+        startup_mark("OpenGL imported")
+
+def warm_imports():
+    """Pull in cv2 off the GUI thread, so the first video doesn't wait for it."""
+    import cv2
+    startup_mark("cv2 imported (background)")
+
+startup_mark("imports")
+
+def drive_file_id(url):
+    """Return the Google Drive file id in url, or None if it doesn't contain one."""
+    if not url:
         return None
+    m = re.search(r"id=([A-Za-z0-9_\-]+)", url)
+    if m:
+        return m.group(1)
+    # common alternate format: /file/d/<id>/...
+    m2 = re.search(r"/d/([A-Za-z0-9_\-]+)", url)
+    if m2:
+        return m2.group(1)
+    return None
 
 def drive_to_direct(url):
     """
@@ -55,15 +113,341 @@ def drive_to_direct(url):
     # If already contains 'uc?id=' or 'export=download', leave it
     if "uc?export=download" in url or "uc?id=" in url:
         return url
-    m = re.search(r"id=([A-Za-z0-9_\-]+)", url)
-    if m:
-        return f"https://drive.google.com/uc?id={m.group(1)}"
-    # common alternate format: /file/d/<id>/...
-    m2 = re.search(r"/d/([A-Za-z0-9_\-]+)", url)
-    if m2:
-        return f"https://drive.google.com/uc?id={m2.group(1)}"
+    file_id = drive_file_id(url)
+    if file_id:
+        return f"https://drive.google.com/uc?id={file_id}"
     return url
 
+def make_http_session(pool_size=LOADER_WORKERS):
+    """requests.Session whose keep-alive pool is shared by all loader workers."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class DownloadCancelled(Exception):
+    """Raised inside a download when its incident load was cancelled."""
+
+class DownloadStream:
+    """
+    A download that can be read while it is still being written.
+
+    AssetCache fills it in (start / advance / finish or fail) from the
+    downloading thread; a VideoDecoder waits on it for more bytes. Once
+    finished, path points at the committed cache blob.
+    """
+
+    def __init__(self, on_start=None):
+        self.on_start = on_start
+        self.path = None
+        self.total = None  # from Content-Length, None if the server didn't say
+        self.received = 0
+        self.failed = False
+        self.done = threading.Event()
+        self.cond = threading.Condition()
+
+    @property
+    def complete(self):
+        return self.done.is_set() and not self.failed
+
+    def fraction(self):
+        return min(1.0, self.received / self.total) if self.total else None
+
+    def start(self, path, total):
+        self.path = path
+        self.total = total
+        if self.on_start is not None:
+            self.on_start(self)
+
+    def advance(self, nbytes):
+        with self.cond:
+            self.received += nbytes
+            self.cond.notify_all()
+
+    def finish(self, path):
+        with self.cond:
+            self.path = path
+            self.done.set()
+            self.cond.notify_all()
+
+    def fail(self):
+        with self.cond:
+            self.failed = True
+            self.done.set()
+            self.cond.notify_all()
+
+    def wait_for(self, nbytes, timeout):
+        """Wait until nbytes have arrived or the download ended; True if either happened."""
+        with self.cond:
+            return self.cond.wait_for(
+                lambda: self.received >= nbytes or self.done.is_set(), timeout)
+
+# ----------------------------
+# Persistent asset cache
+# ----------------------------
+class AssetCache:
+    """
+    On-disk cache for downloaded assets, keyed by Drive file id.
+
+    File contents are stored once under their sha256 (blobs/<sha><ext>), and
+    index.json maps each key to its blob plus the ETag / Last-Modified
+    validators and last access time. Hits inside ASSET_REVALIDATE_AFTER cost
+    no network traffic; older hits are revalidated with a conditional GET.
+    Least recently used entries are evicted once the blobs exceed max_mb.
+    Access times from plain hits are only kept in memory and written with the
+    next index save, ASSET_INDEX_FLUSH_S later, or at exit.
+    """
+
+    def __init__(self, root=ASSET_CACHE_DIR, max_mb=ASSET_CACHE_MAX_MB,
+                 revalidate_after=ASSET_REVALIDATE_AFTER, session=None):
+        self.root = root
+        self._session = session
+        self.blob_dir = os.path.join(root, "blobs")
+        self.index_path = os.path.join(root, "index.json")
+        self.max_bytes = max_mb * 1024 * 1024
+        self.revalidate_after = revalidate_after
+        self.lock = threading.RLock()
+        self.verified = set()  # blobs whose sha256 was checked this session
+        self.flush_timer = None  # pending save of access times, see _touch
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.entries = self._load_index()
+        atexit.register(self.flush)
+
+    @property
+    def session(self):
+        """HTTP session, created on the first download (keeps requests out of startup)."""
+        with self.lock:
+            if self._session is None:
+                self._session = make_http_session()
+            return self._session
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.index_path)
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()  # the access times went out with this save
+            self.flush_timer = None
+
+    def _touch(self, entry, now):
+        """Record an access in memory; the index is written ASSET_INDEX_FLUSH_S later at the latest."""
+        entry["atime"] = now
+        if self.flush_timer is None:
+            self.flush_timer = threading.Timer(ASSET_INDEX_FLUSH_S, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def flush(self):
+        """Write access times still held in memory."""
+        with self.lock:
+            if self.flush_timer is not None:
+                self._save_index()
+
+    @staticmethod
+    def key_for(url):
+        file_id = drive_file_id(url)
+        if file_id:
+            return f"drive:{file_id}"
+        return "url:" + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, entry):
+        return os.path.join(self.blob_dir, entry["blob"])
+
+    def _valid(self, entry):
+        """
+        Integrity check: size on every hit, full sha256 once per session.
+        Called without the lock: hashing a large video mustn't hold up the other loaders.
+        """
+        path = self._blob_path(entry)
+        try:
+            if os.path.getsize(path) != entry["size"]:
+                return False
+            if entry["blob"] in self.verified:
+                return True
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except OSError:
+            return False  # e.g. evicted while we were reading it
+        return h.hexdigest() == entry["sha256"]
+
+    def lookup(self, url):
+        """Return the cached entry for url if present and intact, else None."""
+        key = self.key_for(url)
+        while True:
+            with self.lock:
+                entry = self.entries.get(key)
+            if entry is None:
+                return None
+            valid = self._valid(entry)
+            with self.lock:
+                if self.entries.get(key) is not entry:
+                    continue  # replaced or dropped while we checked it: look again
+                if valid:
+                    self.verified.add(entry["blob"])
+                    return entry
+                print("Cache entry failed integrity check, refetching:", url)
+                self._drop(key)
+                self._save_index()
+                return None
+
+    def get(self, url, timeout=30, cancel=None, stream=None):
+        """
+        Return a local path holding url's content, or None on failure.
+        cancel is an optional threading.Event that aborts an in-flight download;
+        stream is an optional DownloadStream that is fed while a miss downloads.
+        """
+        key = self.key_for(url)
+        entry = self.lookup(url)
+        now = time.time()
+        if entry and now - entry["checked"] < self.revalidate_after:
+            with self.lock:
+                self._touch(entry, now)
+            return self._blob_path(entry)
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            with self.session.get(drive_to_direct(url), headers=headers,
+                                  stream=True, timeout=timeout) as r:
+                if r.status_code == 304 and entry:
+                    with self.lock:
+                        entry["checked"] = entry["atime"] = now
+                        self._save_index()
+                    return self._blob_path(entry)
+                r.raise_for_status()
+                return self._store(key, r, cancel, stream)
+        except DownloadCancelled:
+            return None
+        except Exception as e:
+            print("Download error:", e, url)
+            # a stale copy is better than nothing when offline
+            return self._blob_path(entry) if entry else None
+
+    def _store(self, key, response, cancel=None, stream=None):
+        ctype = response.headers.get("Content-Type", "").split(";")[0].strip()
+        ext = (mimetypes.guess_extension(ctype) or "") if ctype else ""
+        tmp = os.path.join(self.root, f"{key.replace(':', '_')}.{threading.get_ident()}.part{ext}")
+        h = hashlib.sha256()
+        size = 0
+        if stream is not None:
+            stream.start(tmp, int(response.headers.get("Content-Length") or 0) or None)
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    if cancel is not None and cancel.is_set():
+                        raise DownloadCancelled()
+                    if chunk:
+                        f.write(chunk)
+                        h.update(chunk)
+                        size += len(chunk)
+                        if stream is not None:
+                            # make the bytes visible to a reader of the growing file
+                            f.flush()
+                            stream.advance(len(chunk))
+            digest = h.hexdigest()
+            blob = digest + ext
+            try:
+                os.replace(tmp, os.path.join(self.blob_dir, blob))
+            except PermissionError:
+                # a streaming reader still has the part file open (Windows)
+                shutil.copyfile(tmp, os.path.join(self.blob_dir, blob))
+        except BaseException:
+            if stream is not None:
+                stream.fail()
+            raise
+        finally:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except OSError:
+                pass
+
+        now = time.time()
+        with self.lock:
+            old = self.entries.get(key)
+            self.entries[key] = {
+                "blob": blob,
+                "sha256": digest,
+                "size": size,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked": now,
+                "atime": now,
+            }
+            self.verified.add(blob)
+            if old and old["blob"] != blob:
+                self._release_blob(old["blob"])
+            self._evict(keep=key)
+            self._save_index()
+            path = self._blob_path(self.entries[key])
+        if stream is not None:
+            stream.finish(path)
+        return path
+
+    def _drop(self, key):
+        entry = self.entries.pop(key, None)
+        if entry:
+            self._release_blob(entry["blob"])
+
+    def _release_blob(self, blob):
+        """Delete a blob file once no index entry refers to it."""
+        if any(e["blob"] == blob for e in self.entries.values()):
+            return
+        self.verified.discard(blob)
+        try:
+            os.remove(os.path.join(self.blob_dir, blob))
+        except OSError:
+            pass
+
+    def _total_bytes(self):
+        return sum({e["blob"]: e["size"] for e in self.entries.values()}.values())
+
+    def _evict(self, keep=None):
+        """Drop least recently used entries until the blobs fit in max_bytes."""
+        lru = sorted(self.entries, key=lambda k: self.entries[k]["atime"])
+        for key in lru:
+            if self._total_bytes() <= self.max_bytes:
+                break
+            if key != keep:
+                self._drop(key)
+
+asset_cache = AssetCache()
+# worker pool for incident assets; shared so connections are reused across incidents
+loader_pool = ThreadPoolExecutor(max_workers=LOADER_WORKERS, thread_name_prefix="terra-loader")
+
+# ----------------------------
+# Helper: download files
+# ----------------------------
+def download_file(url, timeout=30, cancel=None, stream=None):
+    """Return a local path with url's content, downloading only on a cache miss."""
+    return asset_cache.get(url, timeout=timeout, cancel=cancel, stream=stream)
+
+def download_image_to_pixmap(url):
+    path = download_file(url, timeout=20)
+    if not path:
+        print("Image download failed:", url)
+        return None
+    pix = QPixmap(path)
+    return None if pix.isNull() else pix
+
 # ----------------------------
 # Built-in data: 10 forest-fire events
 # (Populated from links you provided earlier.)
@@ -73,209 +457,209 @@ disasters = {
         {
             "name": "Amazon Rainforest Fire",
             "location": "Brazil – 2019",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1bTx19oxt3T_X5qd4rFLIlH3KEkm7oeMk"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1jV5tKOmAnIMVI0bu-qxT6Vo-N8CGinTg"),
+            "video": "https://drive.google.com/uc?id=1bTx19oxt3T_X5qd4rFLIlH3KEkm7oeMk",
+            "text": "https://drive.google.com/uc?id=1jV5tKOmAnIMVI0bu-qxT6Vo-N8CGinTg",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=12SSqzs5yTR178dkJ9gI0FmmoGIgU6NRc"),
-                drive_to_direct("https://drive.google.com/uc?id=1CkHf-dVF3SYV_b65s_gyScQMTEjHAOL3"),
-                drive_to_direct("https://drive.google.com/uc?id=16O8CQ8ypPaulSBjSVepAlNtdMGu9NKrp"),
-                drive_to_direct("https://drive.google.com/uc?id=15H3Op3lseMUyRQeUsKp2GMPFaKcDcv8v")
+                "https://drive.google.com/uc?id=12SSqzs5yTR178dkJ9gI0FmmoGIgU6NRc",
+                "https://drive.google.com/uc?id=1CkHf-dVF3SYV_b65s_gyScQMTEjHAOL3",
+                "https://drive.google.com/uc?id=16O8CQ8ypPaulSBjSVepAlNtdMGu9NKrp",
+                "https://drive.google.com/uc?id=15H3Op3lseMUyRQeUsKp2GMPFaKcDcv8v"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1ah-P4EtKR0noe1ypKGcm4-07_3Z13eQk"),
-                drive_to_direct("https://drive.google.com/uc?id=10633_4iFloMdG8MsqBGZ54LV5PKixZCp"),
-                drive_to_direct("https://drive.google.com/uc?id=13AkuKN1ueW0MjXdx7NDeNLuCzc6e86hc"),
-                drive_to_direct("https://drive.google.com/uc?id=1wJFdsUkOTAKej6y1PjV80GjTZQyVwX7g"),
-                drive_to_direct("https://drive.google.com/uc?id=1I8hRUCWRY-_a6pjpPapiT-AmBfzEJtD4"),
-                drive_to_direct("https://drive.google.com/uc?id=1Nn2FamL9UUZe4nrrSIbwHQH-gGvzJLFU"),
-                drive_to_direct("https://drive.google.com/uc?id=1n5Ocpv6oa6jfJm1hUPpKx_L15sGfMlWe"),
-                drive_to_direct("https://drive.google.com/uc?id=1dG0M0F-J6igUEQh24qDu4T93DgHd3u1w"),
-                drive_to_direct("https://drive.google.com/uc?id=1cib4JE2ox5SYGe4Ub61NdMcxQnMKyzAV"),
-                drive_to_direct("https://drive.google.com/uc?id=1c37fx4w3oaLWM_cW5fZPtDgmKSADE0_g"),
-                drive_to_direct("https://drive.google.com/uc?id=1CRqE5XvucBNXOOtWRdUAuqT5danW-pmH"),
-                drive_to_direct("https://drive.google.com/uc?id=1pPKUyBEQXYHoRbRKJtSMCQAUcJcT2Vew")
+                "https://drive.google.com/uc?id=1ah-P4EtKR0noe1ypKGcm4-07_3Z13eQk",
+                "https://drive.google.com/uc?id=10633_4iFloMdG8MsqBGZ54LV5PKixZCp",
+                "https://drive.google.com/uc?id=13AkuKN1ueW0MjXdx7NDeNLuCzc6e86hc",
+                "https://drive.google.com/uc?id=1wJFdsUkOTAKej6y1PjV80GjTZQyVwX7g",
+                "https://drive.google.com/uc?id=1I8hRUCWRY-_a6pjpPapiT-AmBfzEJtD4",
+                "https://drive.google.com/uc?id=1Nn2FamL9UUZe4nrrSIbwHQH-gGvzJLFU",
+                "https://drive.google.com/uc?id=1n5Ocpv6oa6jfJm1hUPpKx_L15sGfMlWe",
+                "https://drive.google.com/uc?id=1dG0M0F-J6igUEQh24qDu4T93DgHd3u1w",
+                "https://drive.google.com/uc?id=1cib4JE2ox5SYGe4Ub61NdMcxQnMKyzAV",
+                "https://drive.google.com/uc?id=1c37fx4w3oaLWM_cW5fZPtDgmKSADE0_g",
+                "https://drive.google.com/uc?id=1CRqE5XvucBNXOOtWRdUAuqT5danW-pmH",
+                "https://drive.google.com/uc?id=1pPKUyBEQXYHoRbRKJtSMCQAUcJcT2Vew"
             ]
         },
         {
             "name": "August Complex Fires",
             "location": "California – 2020",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1sq0ur4iDhUEjy8NrXrhJlwBxJxPAfvn4"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=16zZZgoG2-ycvQNs9cUb4NFjoONTFwEDW"),
+            "video": "https://drive.google.com/uc?id=1sq0ur4iDhUEjy8NrXrhJlwBxJxPAfvn4",
+            "text": "https://drive.google.com/uc?id=16zZZgoG2-ycvQNs9cUb4NFjoONTFwEDW",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1gm0M7wkM_yviWjznv1lEINsB3B4Ppgtl"),
-                drive_to_direct("https://drive.google.com/uc?id=1EDvaZdAXn6buoizeDq4Q277SyVnw7gSe"),
-                drive_to_direct("https://drive.google.com/uc?id=1y7c2gPR2teGNV0SFew9brqB8pNuv-4kj"),
-                drive_to_direct("https://drive.google.com/uc?id=1YEPniv5JGhF80i4xFcdZFvKMwO39Om0x")
+                "https://drive.google.com/uc?id=1gm0M7wkM_yviWjznv1lEINsB3B4Ppgtl",
+                "https://drive.google.com/uc?id=1EDvaZdAXn6buoizeDq4Q277SyVnw7gSe",
+                "https://drive.google.com/uc?id=1y7c2gPR2teGNV0SFew9brqB8pNuv-4kj",
+                "https://drive.google.com/uc?id=1YEPniv5JGhF80i4xFcdZFvKMwO39Om0x"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1AVo4LLTcmOYpWOXZZ7tXrHdIO7RVRoeA"),
-                drive_to_direct("https://drive.google.com/uc?id=1K6aBVY_TU80HvDw2-QwcHW6iGTR48R7j"),
-                drive_to_direct("https://drive.google.com/uc?id=1PKGcZAxmstOr7oPpxK-d6C_aLCTB3G0x"),
-                drive_to_direct("https://drive.google.com/uc?id=1lRNltHTSYYttxquT_CpVZ_UaOiiC0J5t"),
-                drive_to_direct("https://drive.google.com/uc?id=1e5ffaTSXh_xZDD0kSK58H6jxl6ZlOVtx"),
-                drive_to_direct("https://drive.google.com/uc?id=1HprSZ9ykepIAOz1lWgVGpbLHKEtPwUj5"),
-                drive_to_direct("https://drive.google.com/uc?id=16g4xlUQa5hXa32btePltbARb-9meHH0y"),
-                drive_to_direct("https://drive.google.com/uc?id=1tiA_iUSfr4AW6F0icLbZkNspQUJ4-JS1"),
-                drive_to_direct("https://drive.google.com/uc?id=1O4LuE7MtAaTspxB9uU-iulu2nMuspYna"),
-                drive_to_direct("https://drive.google.com/uc?id=1FJIdzML5k-1UNutZHdftbDSETF9tw7gR"),
-                drive_to_direct("https://drive.google.com/uc?id=1ZHgOgxCELfV1S3HnRNW5ENNsVk5ETey0"),
-                drive_to_direct("https://drive.google.com/uc?id=1X3ovjfScowapIjFCbiRe-EwzwehxDnWs")
+                "https://drive.google.com/uc?id=1AVo4LLTcmOYpWOXZZ7tXrHdIO7RVRoeA",
+                "https://drive.google.com/uc?id=1K6aBVY_TU80HvDw2-QwcHW6iGTR48R7j",
+                "https://drive.google.com/uc?id=1PKGcZAxmstOr7oPpxK-d6C_aLCTB3G0x",
+                "https://drive.google.com/uc?id=1lRNltHTSYYttxquT_CpVZ_UaOiiC0J5t",
+                "https://drive.google.com/uc?id=1e5ffaTSXh_xZDD0kSK58H6jxl6ZlOVtx",
+                "https://drive.google.com/uc?id=1HprSZ9ykepIAOz1lWgVGpbLHKEtPwUj5",
+                "https://drive.google.com/uc?id=16g4xlUQa5hXa32btePltbARb-9meHH0y",
+                "https://drive.google.com/uc?id=1tiA_iUSfr4AW6F0icLbZkNspQUJ4-JS1",
+                "https://drive.google.com/uc?id=1O4LuE7MtAaTspxB9uU-iulu2nMuspYna",
+                "https://drive.google.com/uc?id=1FJIdzML5k-1UNutZHdftbDSETF9tw7gR",
+                "https://drive.google.com/uc?id=1ZHgOgxCELfV1S3HnRNW5ENNsVk5ETey0",
+                "https://drive.google.com/uc?id=1X3ovjfScowapIjFCbiRe-EwzwehxDnWs"
             ]
         },
         {
             "name": "Australia Bushfires",
             "location": "Australia – 2019-2020",
-            "video": drive_to_direct("https://drive.google.com/uc?id=12czFeITn06ATAbJ7Ctz595C2fmGPziKf"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1fy3dPS8H33sher07ZLqyZA8RnDhnSMGn"),
+            "video": "https://drive.google.com/uc?id=12czFeITn06ATAbJ7Ctz595C2fmGPziKf",
+            "text": "https://drive.google.com/uc?id=1fy3dPS8H33sher07ZLqyZA8RnDhnSMGn",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1qJZUrvYs-BwCM7M8Ae8F_VpuineW5RMs"),
-                drive_to_direct("https://drive.google.com/uc?id=1wxvSGEiwv8xNO5Xcttls4AQ6nnSaQ8ov"),
-                drive_to_direct("https://drive.google.com/uc?id=1Pl3Hnt13jjiTFRek2AvxySvAlc97Q8YF"),
-                drive_to_direct("https://drive.google.com/uc?id=12UO9Pkfhc2ZL7IWJz5aake-AeKpBMrQg")
+                "https://drive.google.com/uc?id=1qJZUrvYs-BwCM7M8Ae8F_VpuineW5RMs",
+                "https://drive.google.com/uc?id=1wxvSGEiwv8xNO5Xcttls4AQ6nnSaQ8ov",
+                "https://drive.google.com/uc?id=1Pl3Hnt13jjiTFRek2AvxySvAlc97Q8YF",
+                "https://drive.google.com/uc?id=12UO9Pkfhc2ZL7IWJz5aake-AeKpBMrQg"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1PKGcZAxmstOr7oPpxK-d6C_aLCTB3G0x"),
-                drive_to_direct("https://drive.google.com/uc?id=1lRNltHTSYYttxquT_CpVZ_UaOiiC0J5t"),
-                drive_to_direct("https://drive.google.com/uc?id=1cib4JE2ox5SYGe4Ub61NdMcxQnMKyzAV"),
-                drive_to_direct("https://drive.google.com/uc?id=1c37fx4w3oaLWM_cW5fZPtDgmKSADE0_g"),
-                drive_to_direct("https://drive.google.com/uc?id=1CRqE5XvucBNXOOtWRdUAuqT5danW-pmH"),
-                drive_to_direct("https://drive.google.com/uc?id=1pPKUyBEQXYHoRbRKJtSMCQAUcJcT2Vew")
+                "https://drive.google.com/uc?id=1PKGcZAxmstOr7oPpxK-d6C_aLCTB3G0x",
+                "https://drive.google.com/uc?id=1lRNltHTSYYttxquT_CpVZ_UaOiiC0J5t",
+                "https://drive.google.com/uc?id=1cib4JE2ox5SYGe4Ub61NdMcxQnMKyzAV",
+                "https://drive.google.com/uc?id=1c37fx4w3oaLWM_cW5fZPtDgmKSADE0_g",
+                "https://drive.google.com/uc?id=1CRqE5XvucBNXOOtWRdUAuqT5danW-pmH",
+                "https://drive.google.com/uc?id=1pPKUyBEQXYHoRbRKJtSMCQAUcJcT2Vew"
             ]
         },
         {
             "name": "Black Saturday Bushfires",
             "location": "Australia – 2009",
-            "video": drive_to_direct("https://drive.google.com/uc?id=14JekVKl12bTkHPdoiWZor9aOp9gF2B0P"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1-wDod1INNQbK5PnoT78vqF6fY7ci_BIC"),
+            "video": "https://drive.google.com/uc?id=14JekVKl12bTkHPdoiWZor9aOp9gF2B0P",
+            "text": "https://drive.google.com/uc?id=1-wDod1INNQbK5PnoT78vqF6fY7ci_BIC",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1Gu1-PpRlQH18L8FUjqBSO0_wBQ_VWaP3"),
-                drive_to_direct("https://drive.google.com/uc?id=1Ub5E7UFw1MX828StukzwTmeQApSUatcY"),
-                drive_to_direct("https://drive.google.com/uc?id=1ajiVyDu4LgyvjqK62rpEg5ZTYYw7fn0Z"),
-                drive_to_direct("https://drive.google.com/uc?id=18lsb3dKKxgA-FMdQI_awv8LfIVcxe5Pb")
+                "https://drive.google.com/uc?id=1Gu1-PpRlQH18L8FUjqBSO0_wBQ_VWaP3",
+                "https://drive.google.com/uc?id=1Ub5E7UFw1MX828StukzwTmeQApSUatcY",
+                "https://drive.google.com/uc?id=1ajiVyDu4LgyvjqK62rpEg5ZTYYw7fn0Z",
+                "https://drive.google.com/uc?id=18lsb3dKKxgA-FMdQI_awv8LfIVcxe5Pb"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1CPdU-kmxTkVHRKy2pLSLM7mq-IIMXX5X"),
-                drive_to_direct("https://drive.google.com/uc?id=1HIkF8cpv3cvYDcOZA-sIgS89OPk8Pztk"),
-                drive_to_direct("https://drive.google.com/uc?id=1DKRnP2lcfRnDKq8A6tHjSkZat7ZZ1g9R"),
-                drive_to_direct("https://drive.google.com/uc?id=1AVwQb50Uu7Pz9JdpIaxtLG2B7SIomWuo"),
-                drive_to_direct("https://drive.google.com/uc?id=1U-y2pTzVF1GOnvA94EGdz8pcMYPAOdnq"),
-                drive_to_direct("https://drive.google.com/uc?id=1PqeNGvhPUGQ-9GgTmV5g8N9BvXl69vIX")
+                "https://drive.google.com/uc?id=1CPdU-kmxTkVHRKy2pLSLM7mq-IIMXX5X",
+                "https://drive.google.com/uc?id=1HIkF8cpv3cvYDcOZA-sIgS89OPk8Pztk",
+                "https://drive.google.com/uc?id=1DKRnP2lcfRnDKq8A6tHjSkZat7ZZ1g9R",
+                "https://drive.google.com/uc?id=1AVwQb50Uu7Pz9JdpIaxtLG2B7SIomWuo",
+                "https://drive.google.com/uc?id=1U-y2pTzVF1GOnvA94EGdz8pcMYPAOdnq",
+                "https://drive.google.com/uc?id=1PqeNGvhPUGQ-9GgTmV5g8N9BvXl69vIX"
             ]
         },
         {
             "name": "Camp Fire",
             "location": "California – 2018",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1ydGLUFzzxlbFWekFBjEs6buckIWfvnAO"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1206EFdEBJ78qUYQruCzzWGEO3qfrjDrJ"),
+            "video": "https://drive.google.com/uc?id=1ydGLUFzzxlbFWekFBjEs6buckIWfvnAO",
+            "text": "https://drive.google.com/uc?id=1206EFdEBJ78qUYQruCzzWGEO3qfrjDrJ",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1EaF8XMlQ_RjANgqPWQgwtCGQH_5h869s"),
-                drive_to_direct("https://drive.google.com/uc?id=1jfW4_ZYTqRlsgmf_t8oMvmwMkn5x4ycB"),
-                drive_to_direct("https://drive.google.com/uc?id=1fCCDNu8-aAUXH-_ypo_-WBw1lnHFofWi"),
-                drive_to_direct("https://drive.google.com/uc?id=1Cvv3orcppCxF5HRTunsG_pQ53U4Sd6tb")
+                "https://drive.google.com/uc?id=1EaF8XMlQ_RjANgqPWQgwtCGQH_5h869s",
+                "https://drive.google.com/uc?id=1jfW4_ZYTqRlsgmf_t8oMvmwMkn5x4ycB",
+                "https://drive.google.com/uc?id=1fCCDNu8-aAUXH-_ypo_-WBw1lnHFofWi",
+                "https://drive.google.com/uc?id=1Cvv3orcppCxF5HRTunsG_pQ53U4Sd6tb"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1xabuGO4L1Dk7cAIF-cIe66nfm7kf7w4f"),
-                drive_to_direct("https://drive.google.com/uc?id=1V6cm7LS9HfyC9s_qrK6vbmOQiA_BYESZ"),
-                drive_to_direct("https://drive.google.com/uc?id=15d4HWXk4LpbbLW5PqNT_YoXexgOA34-e"),
-                drive_to_direct("https://drive.google.com/uc?id=1_PBBpo4Vf__Z8brTYlI3LXh9kmYXrYCV"),
-                drive_to_direct("https://drive.google.com/uc?id=1oyooizCZpdccd5Kdn1EPwOqs7itpDOdP"),
-                drive_to_direct("https://drive.google.com/uc?id=1DNIrhHiqTNJettlCliPZK6aG83U8RYCy")
+                "https://drive.google.com/uc?id=1xabuGO4L1Dk7cAIF-cIe66nfm7kf7w4f",
+                "https://drive.google.com/uc?id=1V6cm7LS9HfyC9s_qrK6vbmOQiA_BYESZ",
+                "https://drive.google.com/uc?id=15d4HWXk4LpbbLW5PqNT_YoXexgOA34-e",
+                "https://drive.google.com/uc?id=1_PBBpo4Vf__Z8brTYlI3LXh9kmYXrYCV",
+                "https://drive.google.com/uc?id=1oyooizCZpdccd5Kdn1EPwOqs7itpDOdP",
+                "https://drive.google.com/uc?id=1DNIrhHiqTNJettlCliPZK6aG83U8RYCy"
             ]
         },
         {
             "name": "Chile Wildfires",
             "location": "2015",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1XpgUvyZ5B0JtSXuL6DJE9JgbL7qyuXsJ"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1OBQT7uJtv8rppEhwB300KoO8MTrzMEpB"),
+            "video": "https://drive.google.com/uc?id=1XpgUvyZ5B0JtSXuL6DJE9JgbL7qyuXsJ",
+            "text": "https://drive.google.com/uc?id=1OBQT7uJtv8rppEhwB300KoO8MTrzMEpB",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1e2K55rj4xyioAYuz2zrZ_44nmcK6YoM-"),
-                drive_to_direct("https://drive.google.com/uc?id=1euGvJc2emQm0UdgXy-PbbXdYHCzEAyqq"),
-                drive_to_direct("https://drive.google.com/uc?id=1e8cp02wPvkMsB2VFUnAXWFl3JZFhYIfE"),
-                drive_to_direct("https://drive.google.com/uc?id=1j6B-f1UIE1WStxkPunyp_laIxaRBd3_l")
+                "https://drive.google.com/uc?id=1e2K55rj4xyioAYuz2zrZ_44nmcK6YoM-",
+                "https://drive.google.com/uc?id=1euGvJc2emQm0UdgXy-PbbXdYHCzEAyqq",
+                "https://drive.google.com/uc?id=1e8cp02wPvkMsB2VFUnAXWFl3JZFhYIfE",
+                "https://drive.google.com/uc?id=1j6B-f1UIE1WStxkPunyp_laIxaRBd3_l"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1ra6ifOyR4uu30Mo2wlQqpeqnPpAjJMXy"),
-                drive_to_direct("https://drive.google.com/uc?id=1dP4M4UkCWZQIkEBwKIuD--JkHNX7F-1a"),
-                drive_to_direct("https://drive.google.com/uc?id=1ryuz8Ol9aLRbo9P3n0XIo07hfm14E0Hk"),
-                drive_to_direct("https://drive.google.com/uc?id=1uOQEmfRFkcheST1vKO7kPmOvodKlHns8"),
-                drive_to_direct("https://drive.google.com/uc?id=1SerrxgH1uytZ0JhAA3zI0IfVABXvNgyp"),
-                drive_to_direct("https://drive.google.com/uc?id=1RfXMxRoVMk3_3o1aFJWXJ3c7aC2shlYo")
+                "https://drive.google.com/uc?id=1ra6ifOyR4uu30Mo2wlQqpeqnPpAjJMXy",
+                "https://drive.google.com/uc?id=1dP4M4UkCWZQIkEBwKIuD--JkHNX7F-1a",
+                "https://drive.google.com/uc?id=1ryuz8Ol9aLRbo9P3n0XIo07hfm14E0Hk",
+                "https://drive.google.com/uc?id=1uOQEmfRFkcheST1vKO7kPmOvodKlHns8",
+                "https://drive.google.com/uc?id=1SerrxgH1uytZ0JhAA3zI0IfVABXvNgyp",
+                "https://drive.google.com/uc?id=1RfXMxRoVMk3_3o1aFJWXJ3c7aC2shlYo"
             ]
         },
         {
             "name": "Maui Wildfires",
             "location": "USA – 2023",
-            "video": drive_to_direct("https://drive.google.com/uc?id=14ry2bpNu_-NFE4IkGuT7AskHYSoga0vq"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1eqbXp38t9LYIjZirJhI8AYsd7g7u54eJ"),
+            "video": "https://drive.google.com/uc?id=14ry2bpNu_-NFE4IkGuT7AskHYSoga0vq",
+            "text": "https://drive.google.com/uc?id=1eqbXp38t9LYIjZirJhI8AYsd7g7u54eJ",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1wjzMB4KZ2FT_1Gw3DXwa-wsTA_kH9t2h"),
-                drive_to_direct("https://drive.google.com/uc?id=13zf-qHskzMC2kg3sUbFGATQwIzeycxjd"),
-                drive_to_direct("https://drive.google.com/uc?id=19_wmM8XBqh4SMekbJPYRk0xQyK415i78"),
-                drive_to_direct("https://drive.google.com/uc?id=1uTqarXrIdLEokc0JSBuM1tJaDdaCKylM")
+                "https://drive.google.com/uc?id=1wjzMB4KZ2FT_1Gw3DXwa-wsTA_kH9t2h",
+                "https://drive.google.com/uc?id=13zf-qHskzMC2kg3sUbFGATQwIzeycxjd",
+                "https://drive.google.com/uc?id=19_wmM8XBqh4SMekbJPYRk0xQyK415i78",
+                "https://drive.google.com/uc?id=1uTqarXrIdLEokc0JSBuM1tJaDdaCKylM"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1RzVeB2ARf98rxk1daZHlSEb-Jc-1vezE"),
-                drive_to_direct("https://drive.google.com/uc?id=1NE48YWMCeh0hqbj4IOQdZmi9m6eOljFj"),
-                drive_to_direct("https://drive.google.com/uc?id=1gnztyLnqd4qoZsVgVgzyrZZIKbhXP28N"),
-                drive_to_direct("https://drive.google.com/uc?id=1945Eph2JRjvI9szEuFi1IyVA_KXAihYk"),
-                drive_to_direct("https://drive.google.com/uc?id=1OrBuHMDwtOhdjnpXoEnp9eEfpZK9tC5I")
+                "https://drive.google.com/uc?id=1RzVeB2ARf98rxk1daZHlSEb-Jc-1vezE",
+                "https://drive.google.com/uc?id=1NE48YWMCeh0hqbj4IOQdZmi9m6eOljFj",
+                "https://drive.google.com/uc?id=1gnztyLnqd4qoZsVgVgzyrZZIKbhXP28N",
+                "https://drive.google.com/uc?id=1945Eph2JRjvI9szEuFi1IyVA_KXAihYk",
+                "https://drive.google.com/uc?id=1OrBuHMDwtOhdjnpXoEnp9eEfpZK9tC5I"
             ]
         },
         {
             "name": "Texas Wildfires",
             "location": "2024",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1MwBMxlRMnsWeC7sPPQ0f9bGJNMad67dh"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1DLqOyfA3r-EnJ4UfxnZdLJNyQ2UIysaJ"),
+            "video": "https://drive.google.com/uc?id=1MwBMxlRMnsWeC7sPPQ0f9bGJNMad67dh",
+            "text": "https://drive.google.com/uc?id=1DLqOyfA3r-EnJ4UfxnZdLJNyQ2UIysaJ",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1yipUU32d0Wm71jTHnzrHfIWt84qHFxS3"),
-                drive_to_direct("https://drive.google.com/uc?id=1rVPDxdQBPsoSXJjIyeCdqwYb-vFXFzQ5"),
-                drive_to_direct("https://drive.google.com/uc?id=1UbCWbGl5BOXVXuSbUwiEd2UHe7SOtcmM"),
-                drive_to_direct("https://drive.google.com/uc?id=1RqzirDJjyHeP6XvEHO5sbzcbd-U8x8u3")
+                "https://drive.google.com/uc?id=1yipUU32d0Wm71jTHnzrHfIWt84qHFxS3",
+                "https://drive.google.com/uc?id=1rVPDxdQBPsoSXJjIyeCdqwYb-vFXFzQ5",
+                "https://drive.google.com/uc?id=1UbCWbGl5BOXVXuSbUwiEd2UHe7SOtcmM",
+                "https://drive.google.com/uc?id=1RqzirDJjyHeP6XvEHO5sbzcbd-U8x8u3"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1Uzf-9GYSzqTHYNmMb7j4oCovn69G4-I3"),
-                drive_to_direct("https://drive.google.com/uc?id=1BCHylrTpFx9dgqlrbZzmawRTed6fHcgo"),
-                drive_to_direct("https://drive.google.com/uc?id=1x0fW3fN8brtnnrRG7yfOsEOVCHCj410W"),
-                drive_to_direct("https://drive.google.com/uc?id=1tHZiCPvmh14sFyPkRY0wsFiTcxNztghz"),
-                drive_to_direct("https://drive.google.com/uc?id=184-gBq9zHpes5ohaC6O0m0y5GZDA6QYt")
+                "https://drive.google.com/uc?id=1Uzf-9GYSzqTHYNmMb7j4oCovn69G4-I3",
+                "https://drive.google.com/uc?id=1BCHylrTpFx9dgqlrbZzmawRTed6fHcgo",
+                "https://drive.google.com/uc?id=1x0fW3fN8brtnnrRG7yfOsEOVCHCj410W",
+                "https://drive.google.com/uc?id=1tHZiCPvmh14sFyPkRY0wsFiTcxNztghz",
+                "https://drive.google.com/uc?id=184-gBq9zHpes5ohaC6O0m0y5GZDA6QYt"
             ]
         },
         {
             "name": "Tubbs Fires",
             "location": "California – 2017",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1iGj3y6Aun134icA2Nq3OOXARdlf776mB"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1P-tqu6hen2AFLtpDTOWkt6gegNjpM-gJ"),
+            "video": "https://drive.google.com/uc?id=1iGj3y6Aun134icA2Nq3OOXARdlf776mB",
+            "text": "https://drive.google.com/uc?id=1P-tqu6hen2AFLtpDTOWkt6gegNjpM-gJ",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1BMTCybytO312yY3E-qyJXnRng9MB_VuJ"),
-                drive_to_direct("https://drive.google.com/uc?id=1lLieYmZa32U4mAvUz6yRTv0GlbYFt9Bs"),
-                drive_to_direct("https://drive.google.com/uc?id=1DRzg-cNMua2Nzr31-iDE-aDz1sYY5vOW"),
-                drive_to_direct("https://drive.google.com/uc?id=1M6rrRZcDrdVC3sTwGMG7p3ZZfQ1p9Ofh")
+                "https://drive.google.com/uc?id=1BMTCybytO312yY3E-qyJXnRng9MB_VuJ",
+                "https://drive.google.com/uc?id=1lLieYmZa32U4mAvUz6yRTv0GlbYFt9Bs",
+                "https://drive.google.com/uc?id=1DRzg-cNMua2Nzr31-iDE-aDz1sYY5vOW",
+                "https://drive.google.com/uc?id=1M6rrRZcDrdVC3sTwGMG7p3ZZfQ1p9Ofh"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1I49FgQEX04ZMZNsjReuUidOwEdJ0r6Wp"),
-                drive_to_direct("https://drive.google.com/uc?id=1HC9n6KJJg5tyFaLNV-RS6QNefI-q9V_L"),
-                drive_to_direct("https://drive.google.com/uc?id=1xYSc8ots7O4TOYalvXzFohDRxdYKYgZ8"),
-                drive_to_direct("https://drive.google.com/uc?id=1dJEYZft1HBuBNl_qIWcCV8wv5uappbOl"),
-                drive_to_direct("https://drive.google.com/uc?id=1rfMxko1q-GG-4gCf5gQXPHD5kRMtMXU1")
+                "https://drive.google.com/uc?id=1I49FgQEX04ZMZNsjReuUidOwEdJ0r6Wp",
+                "https://drive.google.com/uc?id=1HC9n6KJJg5tyFaLNV-RS6QNefI-q9V_L",
+                "https://drive.google.com/uc?id=1xYSc8ots7O4TOYalvXzFohDRxdYKYgZ8",
+                "https://drive.google.com/uc?id=1dJEYZft1HBuBNl_qIWcCV8wv5uappbOl",
+                "https://drive.google.com/uc?id=1rfMxko1q-GG-4gCf5gQXPHD5kRMtMXU1"
             ]
         },
         {
             "name": "Woolsey Fires",
             "location": "California – 2018",
-            "video": drive_to_direct("https://drive.google.com/uc?id=1DNc08sxQs3w-VDuoVRdLlHaroOZz-o7O"),
-            "text": drive_to_direct("https://drive.google.com/uc?id=1jBqamNrjXKOCteJMrFsNkwurYtigUBwH"),
+            "video": "https://drive.google.com/uc?id=1DNc08sxQs3w-VDuoVRdLlHaroOZz-o7O",
+            "text": "https://drive.google.com/uc?id=1jBqamNrjXKOCteJMrFsNkwurYtigUBwH",
             "right_images": [
-                drive_to_direct("https://drive.google.com/uc?id=1M0GjWiC26mkm3Ys8grBAIvU1ONeI4dGa"),
-                drive_to_direct("https://drive.google.com/uc?id=18gwJQHySECEpyZizsTfPUDK7DCxLekGA"),
-                drive_to_direct("https://drive.google.com/uc?id=1YobiO_B_ehQrbTYI4-VvVmVy79ahdXZr"),
-                drive_to_direct("https://drive.google.com/uc?id=12SUajfkP4zMfRCG2xm9xe2bG9Pa97Dct")
+                "https://drive.google.com/uc?id=1M0GjWiC26mkm3Ys8grBAIvU1ONeI4dGa",
+                "https://drive.google.com/uc?id=18gwJQHySECEpyZizsTfPUDK7DCxLekGA",
+                "https://drive.google.com/uc?id=1YobiO_B_ehQrbTYI4-VvVmVy79ahdXZr",
+                "https://drive.google.com/uc?id=12SUajfkP4zMfRCG2xm9xe2bG9Pa97Dct"
             ],
             "slideshow": [
-                drive_to_direct("https://drive.google.com/uc?id=1blMNd5I418BGuStYFjrBaHzAKlZNKtfg"),
-                drive_to_direct("https://drive.google.com/uc?id=1xabuGO4L1Dk7cAIF-cIe66nfm7kf7w4f"),
-                drive_to_direct("https://drive.google.com/uc?id=1hKdV62RgRkTMble_vPnjSpGSEAkOeYwN"),
-                drive_to_direct("https://drive.google.com/uc?id=1z-vYFdPlxtf4q_ztGyl6aWUblYgkjNxT"),
-                drive_to_direct("https://drive.google.com/uc?id=1_Gg2ZglVKhiNG3BvSRJp_93REufTOjz9")
+                "https://drive.google.com/uc?id=1blMNd5I418BGuStYFjrBaHzAKlZNKtfg",
+                "https://drive.google.com/uc?id=1xabuGO4L1Dk7cAIF-cIe66nfm7kf7w4f",
+                "https://drive.google.com/uc?id=1hKdV62RgRkTMble_vPnjSpGSEAkOeYwN",
+                "https://drive.google.com/uc?id=1z-vYFdPlxtf4q_ztGyl6aWUblYgkjNxT",
+                "https://drive.google.com/uc?id=1_Gg2ZglVKhiNG3BvSRJp_93REufTOjz9"
             ]
         }
        
@@ -283,168 +667,875 @@ disasters = {
 }
 
 # ----------------------------
-# Optionally attempt to load remote txt (JSON) from a Drive link you provided.
-# If you want to override the built-in events with a remote JSON file,
-# set REMOTE_EVENTS_URL to a Google Drive link to the JSON (or raw JSON).
-# The uploaded text file you mentioned (drive id 1kMJ...) can be used if it's JSON.
-# If it isn't JSON, the script will keep the built-in 'disasters' above.
+# Event catalog
+# The built-in events above can be overridden by a JSON file with the same
+# structure ({"Forest Fire": [ {...}, ... ]}) at REMOTE_EVENTS_URL (a Google
+# Drive link or raw JSON). Startup never waits for it: the last copy that
+# was downloaded is read from the asset cache, and the window refreshes it
+# in the background and swaps the new one in when it arrives.
 # ----------------------------
-REMOTE_EVENTS_URL = None
+REMOTE_EVENTS_URL = os.environ.get("TERRA_EVENTS_URL") or None
 # Example if you want to automatically load your uploaded file:
 # REMOTE_EVENTS_URL = "https://drive.google.com/uc?id=1kMJfLUWxKP0XUfE77eeTy4cyI9jbDRcH"
+CATALOG_CACHE_PATH = os.path.join(ASSET_CACHE_DIR, "events.json")
+
+def parse_catalog(txt):
+    """The catalog dict in txt, or None if txt isn't one."""
+    try:
+        obj = json.loads(txt)
+    except ValueError:
+        return None
+    return obj if isinstance(obj, dict) and obj else None
 
-def try_load_remote_events(url):
+def load_cached_catalog(path=CATALOG_CACHE_PATH):
+    """Use the last downloaded remote catalog, if there is one."""
     global disasters
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            obj = parse_catalog(f.read())
+    except OSError:
+        return False
+    if obj is None:
+        return False
+    disasters = obj
+    return True
+
+def fetch_remote_catalog(url, path=CATALOG_CACHE_PATH):
+    """Download the remote catalog and keep a copy for the next start. Returns it, or None. Blocking."""
     if not url:
-        return
+        return None
     try:
-        direct = drive_to_direct(url)
-        r = requests.get(direct, timeout=20)
+        r = asset_cache.session.get(drive_to_direct(url), timeout=20)
         r.raise_for_status()
-        txt = r.text.strip()
-        # Try JSON first
+        obj = parse_catalog(r.text.strip())
+    except Exception as e:
+        print("Failed to load remote events:", e)
+        return None
+    if obj is None:
+        print("Remote file downloaded but not JSON. Keeping current events.")
+        return None
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print("Could not cache remote events:", e)
+    return obj
+
+if load_cached_catalog():
+    startup_mark("catalog (cached remote copy)")
+else:
+    startup_mark("catalog (built-in)")
+
+# ----------------------------
+# Background incident loader
+# ----------------------------
+class IncidentLoader(QObject):
+    """
+    Fetches every asset of one incident on loader_pool and hands the results
+    to the GUI thread through queued signals as each one arrives. Images are
+    reported as local paths; SlideshowCache decodes and scales them.
+
+    Jobs are queued so that the description and the first slideshow frames
+    come back before the (large) globe video. cancel() drops queued jobs and
+    aborts downloads that are already running.
+    """
+    text_ready = pyqtSignal(str)
+    left_image_ready = pyqtSignal(int, str)
+    right_image_ready = pyqtSignal(int, str)
+    video_streaming = pyqtSignal(object)  # DownloadStream, playable while it downloads
+    video_ready = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, incident, parent=None):
+        super().__init__(parent)
+        self.incident = incident
+        self.cancelled = threading.Event()
+        self.futures = []
+
+    def start(self):
+        left = list(enumerate(self.incident.get("slideshow", [])))
+        right = list(enumerate(self.incident.get("right_images", [])))
+        self._submit(self._load_text)
+        for i, url in left[:2]:
+            self._submit(self._load_image, self.left_image_ready, i, url)
+        for i, url in right[:1]:
+            self._submit(self._load_image, self.right_image_ready, i, url)
+        self._submit(self._load_video)
+        for i, url in left[2:]:
+            self._submit(self._load_image, self.left_image_ready, i, url)
+        for i, url in right[1:]:
+            self._submit(self._load_image, self.right_image_ready, i, url)
+
+    def cancel(self):
+        self.cancelled.set()
+        for fut in self.futures:
+            fut.cancel()
+
+    def _submit(self, fn, *args):
+        self.futures.append(loader_pool.submit(self._run, fn, *args))
+
+    def _run(self, fn, *args):
+        if self.cancelled.is_set():
+            return
+        try:
+            fn(*args)
+        except Exception as e:
+            print("Incident loader error:", e)
+
+    def _load_text(self):
+        text_url = self.incident.get("text")
+        if not text_url:
+            self.text_ready.emit("No description available.")
+            return
+        path = download_file(text_url, cancel=self.cancelled)
+        if self.cancelled.is_set():
+            return
+        if not path:
+            self.text_ready.emit("Failed to download description.")
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.text_ready.emit(f.read())
+        except Exception as e:
+            self.text_ready.emit(f"Error reading description: {e}")
+
+    def _load_image(self, signal, index, url):
+        path = download_file(url, cancel=self.cancelled)
+        if path and not self.cancelled.is_set():
+            signal.emit(index, path)
+
+    def _load_video(self):
+        video_url = self.incident.get("video")
+        if not video_url:
+            self.failed.emit("No video provided for this incident.")
+            return
+        # on a cache miss the globe starts playing the partial file right away
+        stream = DownloadStream(on_start=self.video_streaming.emit)
+        path = download_file(video_url, cancel=self.cancelled, stream=stream)
+        if self.cancelled.is_set():
+            return
+        if path and os.path.exists(path):
+            self.video_ready.emit(path)
+        else:
+            self.failed.emit("Failed to download globe video.")
+
+# ----------------------------
+# Slideshow frames, pre-scaled to the label size
+# ----------------------------
+class SlideshowCache(QObject):
+    """
+    Slideshow images decoded and scaled once to the label's size on
+    loader_pool, so advancing a slide is just setPixmap().
+
+    Only the scaled copies are kept in memory. When the label is resized
+    the frames are re-decoded from their asset cache files (debounced) and
+    swapped in as they arrive; results from an older size or an older
+    incident are dropped via the generation counter.
+    """
+    scaled = pyqtSignal(int, int, QImage)  # generation, index, image
+    frame_added = pyqtSignal()
+
+    def __init__(self, label, parent=None):
+        super().__init__(parent)
+        self.label = label
+        self.paths = {}  # catalogue index -> file in the asset cache
+        self.order = []  # catalogue indices of ready frames, sorted
+        self.pixmaps = []
+        self.generation = 0
+        self.scaled.connect(self._on_scaled)
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(150)
+        self.resize_timer.timeout.connect(self.rebuild)
+        label.installEventFilter(self)
+
+    def __len__(self):
+        return len(self.pixmaps)
+
+    def pixmap(self, i):
+        return self.pixmaps[i]
+
+    def clear(self):
+        self.generation += 1
+        self.paths.clear()
+        self.order.clear()
+        self.pixmaps.clear()
+
+    def add(self, index, path):
+        self.paths[index] = path
+        self._submit(index, path)
+
+    def rebuild(self):
+        """Rescale every frame for the current label size; old frames stay up until replaced."""
+        self.generation += 1
+        for index, path in self.paths.items():
+            self._submit(index, path)
+
+    def eventFilter(self, obj, event):
+        if obj is self.label and event.type() == QEvent.Resize and self.paths:
+            self.resize_timer.start()
+        return False
+
+    def _submit(self, index, path):
+        size = self.label.size()
+        if size.width() > 0 and size.height() > 0:
+            loader_pool.submit(self._scale, self.generation, index, path,
+                               size.width(), size.height())
+
+    def _scale(self, generation, index, path, w, h):
+        if generation != self.generation:
+            return
+        # QImageReader (unlike QPixmap) is safe off the GUI thread, and lets
+        # the JPEG decoder scale while decoding instead of after
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        src = reader.size()
+        if src.isValid():
+            reader.setScaledSize(src.scaled(w, h, Qt.KeepAspectRatio))
+        img = reader.read()
+        if img.isNull():
+            print("Could not decode slideshow image:", path, reader.errorString())
+            return
+        if img.width() > w or img.height() > h:
+            img = img.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.scaled.emit(generation, index, img)
+
+    def _on_scaled(self, generation, index, img):
+        if generation != self.generation:
+            return
+        pix = QPixmap.fromImage(img)
+        pos = bisect.bisect_left(self.order, index)
+        if pos < len(self.order) and self.order[pos] == index:
+            self.pixmaps[pos] = pix
+            return
+        # keep slides in catalogue order even though downloads finish out of order
+        self.order.insert(pos, index)
+        self.pixmaps.insert(pos, pix)
+        self.frame_added.emit()
+
+# ----------------------------
+# Video decoding (producer thread + ring buffer)
+# ----------------------------
+class FrameRingBuffer:
+    """
+    Bounded FIFO of (presentation_time, frame) shared by a VideoDecoder and
+    the paint path. put() blocks while the buffer is full; take_latest()
+    never blocks and skips frames whose time has already passed.
+    """
+
+    def __init__(self, capacity=VIDEO_BUFFER_FRAMES):
+        self.capacity = capacity
+        self.frames = deque()
+        self.cond = threading.Condition()
+        self.closed = False
+
+    def put(self, pts, frame):
+        with self.cond:
+            while len(self.frames) >= self.capacity and not self.closed:
+                self.cond.wait()
+            if self.closed:
+                return False
+            self.frames.append((pts, frame))
+            return True
+
+    def take_latest(self, clock):
+        """Pop every frame due at clock and return the newest one, or None."""
+        latest = None
+        with self.cond:
+            while self.frames and self.frames[0][0] <= clock:
+                latest = self.frames.popleft()
+            if latest is not None:
+                self.cond.notify()
+        return latest
+
+    def peek_pts(self):
+        with self.cond:
+            return self.frames[0][0] if self.frames else None
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.frames.clear()
+            self.cond.notify_all()
+
+class VideoDecoder(threading.Thread):
+    """
+    Decodes a video file into a FrameRingBuffer on its own thread.
+
+    Frames stay in OpenCV's BGR, top-row-first layout: the globe uploads them
+    as GL_BGR and its sphere mesh has t=0 at the north pole, so no per-frame
+    conversion copies are made here. Frames are stamped with presentation times (seconds since playback
+    start) derived from the container timestamps and VIDEO_PLAYBACK_RATE.
+    At end of file the decoder seeks back and keeps going, so the frames
+    after the loop boundary are already buffered when the paint path
+    reaches it.
+
+    With a DownloadStream source the file may still be growing: opening
+    waits for STREAM_START_BYTES, and when decoding catches up with the
+    download it waits for more data, reopens and seeks back to where it was.
+    """
+
+    def __init__(self, path, frames, playback_rate=VIDEO_PLAYBACK_RATE, source=None):
+        super().__init__(daemon=True, name="terra-video-decoder")
+        self.path = path
+        self.frames = frames
+        self.playback_rate = playback_rate
+        self.source = source
+        self.opened_complete = source is None  # was the capture opened on the whole file?
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+        self.frames.close()
+
+    def _open(self):
+        """Open the video, waiting for a streamed download to deliver enough of it."""
+        import cv2
+        if self.source is None:
+            # OpenCV expects a filename
+            cap = cv2.VideoCapture(self.path)
+            return cap if cap.isOpened() else None
+        need = self.source.received + STREAM_START_BYTES
+        while not self.stop_event.is_set():
+            if not self.source.wait_for(need, timeout=0.25):
+                continue
+            if self.source.failed:
+                return None
+            self.opened_complete = self.source.complete
+            cap = cv2.VideoCapture(self.source.path)
+            if cap.isOpened():
+                return cap
+            cap.release()
+            if self.source.done.is_set():
+                return None
+            # e.g. the MP4 index isn't there yet: try again with more data
+            need = self.source.received + STREAM_START_BYTES
+        return None
+
+    def run(self):
+        import cv2
+        cap = None
         try:
-            obj = json.loads(txt)
-            # Expecting same structure: {"Forest Fire": [ {...}, ... ]}
-            if isinstance(obj, dict):
-                disasters = obj
-                print("Loaded remote disasters (JSON).")
+            cap = self._open()
+            if cap is None:
+                if not self.stop_event.is_set():
+                    print("Failed to open video:", self.path)
                 return
+            fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+            loop_offset = 0.0  # video seconds played in earlier loops
+            last_pts = 0.0
+            index = 0
+            while not self.stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret and not self.opened_complete:
+                    # caught up with the download: reopen with more data and seek back
+                    cap.release()
+                    cap = self._open()
+                    if cap is None:
+                        if not self.stop_event.is_set():
+                            print("Video download failed:", self.path)
+                        return
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+                    continue
+                if not ret:
+                    if index == 0:
+                        print("Video has no frames:", self.path)
+                        return
+                    # loop: seek back here instead of on the GUI thread
+                    loop_offset += last_pts + 1.0 / fps
+                    index = 0
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+                pos_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+                last_pts = pos_ms / 1000.0 if pos_ms > 0 else index / fps
+                index += 1
+                if not self.frames.put((loop_offset + last_pts) / self.playback_rate, frame):
+                    return
+        except Exception as e:
+            print("OpenCV decode error:", e)
+        finally:
+            if cap is not None:
+                cap.release()
+
+# ----------------------------
+# Frame scheduler (one timer for the globe and both slideshows)
+# ----------------------------
+class ScheduledTask:
+    """A periodic callback run by FrameScheduler; mirrors the bits of QTimer we used."""
+
+    def __init__(self, scheduler, interval_ms, callback):
+        self.scheduler = scheduler
+        self.interval = interval_ms / 1000.0
+        self.callback = callback
+        self.due = None  # monotonic time of the next run, None while stopped
+
+    def setInterval(self, interval_ms):
+        self.interval = interval_ms / 1000.0
+
+    def start(self):
+        self.due = time.monotonic() + self.interval
+        self.scheduler.wake()
+
+    def stop(self):
+        self.due = None
+
+    def isActive(self):
+        return self.due is not None
+
+class FrameScheduler(QObject):
+    """
+    Drives every periodic redraw from a single single-shot timer.
+
+    Views (the globe) report the next time they need a repaint through
+    next_deadline(now) and get tick(now) calls; tasks are plain periodic
+    callbacks (the slideshows). The timer is armed for the earliest
+    deadline only, never faster than the display refresh rate, stops
+    entirely when nothing is animating, and drops to a slow visibility
+    poll while the window is minimized, hidden or not exposed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.views = []
+        self.tasks = []
+        self.frame_interval = 1.0 / 60
+        self.paused = False
+
+    def add_view(self, view):
+        self.views.append(view)
+        self.wake()
+
+    def task(self, interval_ms, callback):
+        task = ScheduledTask(self, interval_ms, callback)
+        self.tasks.append(task)
+        return task
+
+    def wake(self):
+        """Re-evaluate deadlines soon (something started or changed)."""
+        if not self.timer.isActive() or self.timer.remainingTime() > 0:
+            self.timer.start(0)
+
+    def _window(self):
+        parent = self.parent()
+        return parent.window() if parent is not None else None
+
+    def _hidden(self):
+        w = self._window()
+        if w is None:
+            return False
+        handle = w.windowHandle()
+        return (not w.isVisible() or w.isMinimized()
+                or (handle is not None and not handle.isExposed()))
+
+    def _update_refresh_rate(self):
+        w = self._window()
+        try:
+            hz = w.screen().refreshRate() if w is not None else 0
         except Exception:
-            pass
-        # Not JSON — don't override built-in; just print head for debug
-        print("Remote file downloaded but not JSON. Keeping built-in events.")
-    except Exception as e:
-        print("Failed to load remote events:", e)
+            hz = 0
+        if hz and hz > 1:
+            self.frame_interval = 1.0 / hz
 
-# Try load remote events at start if provided
-try_load_remote_events(REMOTE_EVENTS_URL)
+    def tick(self):
+        now = time.monotonic()
+        if self._hidden():
+            self.paused = True
+            self.timer.start(PAUSED_POLL_MS)
+            return
+        if self.paused:
+            self.paused = False
+            self._update_refresh_rate()
+            for view in self.views:
+                view.resume(now)
+
+        for task in self.tasks:
+            if task.due is not None and task.due <= now:
+                task.callback()
+                # keep the cadence, but don't try to catch up on missed runs
+                task.due = max(task.due + task.interval, now)
+        for view in self.views:
+            view.tick(now)
+
+        deadlines = [t.due for t in self.tasks if t.due is not None]
+        for view in self.views:
+            d = view.next_deadline(now)
+            if d is not None:
+                deadlines.append(max(d, now + self.frame_interval))
+        if deadlines:
+            self.timer.start(max(0, int((min(deadlines) - now) * 1000)))
+
+class FpsOverlay(QLabel):
+    """Small FPS / frame-time readout drawn over the globe (TERRA_SHOW_FPS=1)."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setStyleSheet("background-color:rgba(0,0,0,140); color:#0f0; font:11px monospace; padding:2px;")
+        self.move(6, 6)
+        self.frames = 0
+        self.busy = 0.0
+        self.window_start = time.monotonic()
+        self.setText("-- fps")
+        self.adjustSize()
+
+    def record(self, paint_seconds):
+        self.frames += 1
+        self.busy += paint_seconds
+        now = time.monotonic()
+        elapsed = now - self.window_start
+        if elapsed >= 0.5:
+            self.setText(f"{self.frames / elapsed:5.1f} fps  {1000 * self.busy / self.frames:5.2f} ms/frame")
+            self.adjustSize()
+            self.frames = 0
+            self.busy = 0.0
+            self.window_start = now
+
+# ----------------------------
+# Globe geometry
+# ----------------------------
+def build_sphere_mesh(stacks, slices, radius=1.0):
+    """
+    Interleaved float32 (x, y, z, s, t) vertices and uint32 triangle indices
+    for a UV sphere with its poles on the y axis.
+
+    Texture coordinates are equirectangular: s runs with longitude from
+    -180 (s=0) to 180 (s=1) and t with latitude from the north pole (t=0)
+    down, i.e. image rows top first. Longitude 0 faces the camera (+z).
+    The seam column is duplicated so s can reach 1.0.
+    """
+    lat = np.linspace(0.0, np.pi, stacks + 1, dtype=np.float32)
+    lon = np.linspace(-np.pi, np.pi, slices + 1, dtype=np.float32)
+    theta, phi = np.meshgrid(lat, lon, indexing="ij")
+    vertices = np.empty((stacks + 1, slices + 1, 5), dtype=np.float32)
+    vertices[..., 0] = radius * np.sin(theta) * np.sin(phi)
+    vertices[..., 1] = radius * np.cos(theta)
+    vertices[..., 2] = radius * np.sin(theta) * np.cos(phi)
+    vertices[..., 3] = (phi + np.pi) / (2 * np.pi)
+    vertices[..., 4] = theta / np.pi
+
+    row = slices + 1
+    a = (np.arange(stacks)[:, None] * row + np.arange(slices)[None, :]).ravel()
+    b = a + row
+    indices = np.stack([a, b, a + 1, a + 1, b, b + 1], axis=1).astype(np.uint32)
+    return vertices.reshape(-1, 5), indices.ravel()
+
+class SphereMesh:
+    """Sphere geometry uploaded once into vertex/index buffers and drawn with one call."""
+    STRIDE = 5 * 4  # bytes per vertex: xyz + st as float32
+
+    def __init__(self, stacks, slices):
+        vertices, indices = build_sphere_mesh(stacks, slices)
+        self.count = indices.size
+        self.vbo, self.ibo = (int(b) for b in GL.glGenBuffers(2))
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL.GL_STATIC_DRAW)
+        GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        GL.glBufferData(GL.GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL.GL_STATIC_DRAW)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def draw(self):
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glEnableClientState(GL.GL_TEXTURE_COORD_ARRAY)
+        GL.glVertexPointer(3, GL.GL_FLOAT, self.STRIDE, ctypes.c_void_p(0))
+        GL.glTexCoordPointer(2, GL.GL_FLOAT, self.STRIDE, ctypes.c_void_p(12))
+        GL.glDrawElements(GL.GL_TRIANGLES, self.count, GL.GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        GL.glDisableClientState(GL.GL_TEXTURE_COORD_ARRAY)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, 0)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+    def delete(self):
+        GL.glDeleteBuffers(2, [self.vbo, self.ibo])
 
 # ----------------------------
 # OpenGL widget: sphere textured with current video frame
 # ----------------------------
 class VideoTextureGlobe(QOpenGLWidget):
-    def __init__(self, video_path=None, parent=None):
+    def __init__(self, video_path=None, parent=None, scheduler=None):
         super().__init__(parent)
-        self.video_path = video_path
-        self.cap = None
+        self.video_path = None
+        self.decoder = None
+        self.frames = None
+        self.source = None  # DownloadStream while the video is still downloading
+        self.first_frame_shown = False
+        self.progress_shown = None
+        self.play_start = 0.0
         self.tex_id = None
+        self.tex_size = None  # (w, h) the texture storage is allocated for
+        self.pbos = []
+        self.pbo_index = 0
+        self.meshes = {}  # segments -> SphereMesh, built on first use
+        self.painted = False  # for the startup trace
         self.angle_x = 0.0
         self.angle_y = 0.0
         self.zoom = -3.0
         self.auto_rotate = True
         self.dragging = False
         self.last_pos = None
-        self.frame_counter = 0
+        self.rotate_clock = time.monotonic()
+        self.fps_overlay = FpsOverlay(self) if SHOW_FPS else None
+        self.progress_label = QLabel(self)
+        self.progress_label.setStyleSheet("background-color:rgba(0,0,0,160); color:white; padding:4px;")
+        self.progress_label.hide()
+
+        # repaints are driven by the shared scheduler, only when something changed
+        self.scheduler = scheduler or FrameScheduler(self)
+        self.scheduler.add_view(self)
 
-        # timer to update frames & rotate
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.on_timer)
-        self.timer.start(40)  # ~25 fps (texture updates throttled internally)
+        if video_path:
+            self.set_video(video_path)
 
-    def set_video(self, path):
+    def set_video(self, path, source=None):
+        """Play path; pass the DownloadStream as source if the file is still downloading."""
         # close previous
-        if self.cap:
-            try:
-                self.cap.release()
-            except:
-                pass
-            self.cap = None
+        self.stop_video()
         self.video_path = path
-        try:
-            # OpenCV expects a filename
-            self.cap = cv2.VideoCapture(path)
-            if not self.cap.isOpened():
-                print("Failed to open video:", path)
-                self.cap = None
-        except Exception as e:
-            print("OpenCV open error:", e)
-            self.cap = None
+        self.source = source
+        self.first_frame_shown = False
+        self.progress_shown = None
+        self.frames = FrameRingBuffer()
+        self.decoder = VideoDecoder(path, self.frames, source=source)
+        self.play_start = time.monotonic()
+        self.decoder.start()
+        if source is not None:
+            self.show_progress_text()
+            self.progress_label.show()
+        self.scheduler.wake()
+
+    def download_progress(self):
+        """Download fraction to show instead of the video, or None."""
+        if self.source is None or self.first_frame_shown:
+            return None
+        return self.source.fraction()
+
+    def show_progress_text(self):
+        fraction = self.source.fraction()
+        if fraction is not None:
+            text = f"Downloading video… {fraction * 100:.0f}%"
+        else:
+            text = f"Downloading video… {self.source.received / 1e6:.1f} MB"
+        self.progress_label.setText(text)
+        self.progress_label.adjustSize()
+        self.progress_label.move((self.width() - self.progress_label.width()) // 2,
+                                 self.height() - self.progress_label.height() - 8)
+
+    def upload_progress(self, fraction):
+        """Paint the globe as a progress gauge: it fills from the north pole down."""
+        rows = 64
+        filled = int(round(fraction * rows))
+        if filled == self.progress_shown:
+            return
+        gauge = np.full((rows, 1, 3), 40, dtype=np.uint8)
+        gauge[:filled] = (0, 140, 255)  # BGR orange
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.tex_id)
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGB8, 1, rows, 0, GL.GL_BGR, GL.GL_UNSIGNED_BYTE, gauge)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        self.tex_size = (1, rows)
+        self.progress_shown = filled
+
+    def stop_video(self):
+        if self.decoder is not None:
+            self.decoder.stop()
+            self.decoder = None
+            self.frames = None
+        self.source = None
+        self.progress_label.hide()
+
+    def next_video_frame(self):
+        """Latest decoded frame due for display, or None to keep the current texture."""
+        if self.frames is None:
+            return None
+        clock = time.monotonic() - self.play_start
+        head = self.frames.peek_pts()
+        if head is not None and clock - head > 1.0:
+            # we stalled (hidden window, slow paint): resume from here instead of fast-forwarding
+            self.play_start += clock - head
+            clock = head
+        due = self.frames.take_latest(clock)
+        return due[1] if due else None
 
     def initializeGL(self):
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_TEXTURE_2D)
+        load_gl()
+        GL.glEnable(GL.GL_DEPTH_TEST)
+        GL.glEnable(GL.GL_TEXTURE_2D)
         # Create texture
         if self.tex_id:
             try:
-                glDeleteTextures([self.tex_id])
+                GL.glDeleteTextures([self.tex_id])
             except:
                 pass
             self.tex_id = None
-        self.tex_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, self.tex_id)
+        self.tex_id = GL.glGenTextures(1)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.tex_id)
         # empty placeholder
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, 2, 2, 0, GL_RGB, GL_UNSIGNED_BYTE, b'\xff\x00\xff'*4)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glBindTexture(GL_TEXTURE_2D, 0)
-        glClearColor(0.0, 0.0, 0.0, 1.0)
+        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGB, 2, 2, 0, GL.GL_RGB, GL.GL_UNSIGNED_BYTE, b'\xff\x00\xff'*4)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        self.tex_size = None
+        # a new context means the old buffers are gone
+        self.meshes = {}
+        # two pixel buffer objects for asynchronous uploads
+        self.pbos = []
+        if TEXTURE_USE_PBO:
+            try:
+                self.pbos = [int(b) for b in GL.glGenBuffers(2)]
+            except Exception as e:
+                print("Pixel buffer objects unavailable, uploading directly:", e)
+        GL.glClearColor(0.0, 0.0, 0.0, 1.0)
 
     def resizeGL(self, w, h):
         if h == 0:
             h = 1
-        glViewport(0, 0, w, h)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, w / float(h), 0.1, 100.0)
-        glMatrixMode(GL_MODELVIEW)
+        GL.glViewport(0, 0, w, h)
+        GL.glMatrixMode(GL.GL_PROJECTION)
+        GL.glLoadIdentity()
+        GLU.gluPerspective(45.0, w / float(h), 0.1, 100.0)
+        GL.glMatrixMode(GL.GL_MODELVIEW)
 
     def paintGL(self):
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        glTranslatef(0.0, 0.0, self.zoom)
-        glRotatef(self.angle_x, 1.0, 0.0, 0.0)
-        glRotatef(self.angle_y, 0.0, 1.0, 0.0)
-
-        # Update texture from video if available, but throttle updates slightly for slowness
-        if self.cap is not None:
-            # read frame every few ticks to slow playback on the globe
-            self.frame_counter += 1
-            # change this divisor to slow down more (larger => slower)
-            divisor = 4
-            if self.frame_counter % divisor == 0:
-                ret, frame = self.cap.read()
-                if not ret:
-                    # loop
-                    try:
-                        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                        ret, frame = self.cap.read()
-                    except:
-                        ret = False
-                if ret:
-                    # convert BGR -> RGB, flip vertically (OpenGL expects bottom-to-top)
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame_rgb = cv2.flip(frame_rgb, 0)
-                    h, w, _ = frame_rgb.shape
-                    glBindTexture(GL_TEXTURE_2D, self.tex_id)
-                    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, w, h, 0, GL_RGB, GL_UNSIGNED_BYTE, frame_rgb)
-                    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-                    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-                    glBindTexture(GL_TEXTURE_2D, 0)
+        paint_start = time.perf_counter()
+        if not self.painted:
+            self.painted = True
+            startup_mark("globe first paint")
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+        GL.glLoadIdentity()
+        GL.glTranslatef(0.0, 0.0, self.zoom)
+        GL.glRotatef(self.angle_x, 1.0, 0.0, 0.0)
+        GL.glRotatef(self.angle_y, 0.0, 1.0, 0.0)
+
+        # Update texture with the newest decoded frame (decoding happens on VideoDecoder)
+        frame = self.next_video_frame()
+        if frame is not None:
+            self.upload_frame(frame)
+            if not self.first_frame_shown:
+                self.first_frame_shown = True
+                self.progress_label.hide()
+        else:
+            fraction = self.download_progress()
+            if fraction is not None:
+                self.upload_progress(fraction)
 
         # bind texture and draw sphere
         if self.tex_id:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.tex_id)
+            GL.glEnable(GL.GL_TEXTURE_2D)
+            GL.glBindTexture(GL.GL_TEXTURE_2D, self.tex_id)
         else:
-            glDisable(GL_TEXTURE_2D)
+            GL.glDisable(GL.GL_TEXTURE_2D)
 
-        quad = gluNewQuadric()
-        gluQuadricTexture(quad, GL_TRUE)
-        gluQuadricNormals(quad, GLU_SMOOTH)
-        gluSphere(quad, 1.0, 64, 64)
+        self.sphere_mesh().draw()
 
         if self.tex_id:
-            glBindTexture(GL_TEXTURE_2D, 0)
-            glDisable(GL_TEXTURE_2D)
-
-    def on_timer(self):
-        if self.auto_rotate and not self.dragging:
-            # reduce rotation speed for slower spinning
-            self.angle_y += 0.03
-            if self.angle_y > 360:
-                self.angle_y -= 360
-        self.update()
+            GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+            GL.glDisable(GL.GL_TEXTURE_2D)
+
+        if self.fps_overlay is not None:
+            self.fps_overlay.record(time.perf_counter() - paint_start)
+
+    def sphere_segments(self):
+        """Tessellation for the current zoom: finer close up, coarser far away."""
+        if SPHERE_SEGMENTS > 0:
+            return SPHERE_SEGMENTS
+        if self.zoom > -2.5:
+            return 128
+        if self.zoom > -6.0:
+            return 64
+        return 32
+
+    def sphere_mesh(self):
+        segments = self.sphere_segments()
+        mesh = self.meshes.get(segments)
+        if mesh is None:
+            mesh = self.meshes[segments] = SphereMesh(segments, segments)
+        return mesh
+
+    def upload_frame(self, frame):
+        """
+        Stream a BGR frame into the globe texture.
+
+        Storage is allocated only when the video size changes; after that
+        frames go through glTexSubImage2D. With PBOs the texture is filled
+        from the buffer written on the previous frame while this frame is
+        copied into the other one, so the driver can DMA asynchronously.
+        """
+        h, w, _ = frame.shape
+        nbytes = frame.nbytes
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.tex_id)
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        if self.tex_size != (w, h):
+            GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGB8, w, h, 0, GL.GL_BGR, GL.GL_UNSIGNED_BYTE, None)
+            self.tex_size = (w, h)
+            # seed both buffers so the first frame shown isn't garbage
+            for pbo in self.pbos:
+                GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, pbo)
+                GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, nbytes, frame, GL.GL_STREAM_DRAW)
+        if self.pbos:
+            upload_pbo = self.pbos[self.pbo_index]
+            fill_pbo = self.pbos[1 - self.pbo_index]
+            GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, upload_pbo)
+            GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, 0, 0, w, h, GL.GL_BGR, GL.GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+            GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, fill_pbo)
+            # orphan the old storage so we never wait on a transfer still in flight
+            GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, nbytes, None, GL.GL_STREAM_DRAW)
+            GL.glBufferSubData(GL.GL_PIXEL_UNPACK_BUFFER, 0, nbytes, frame)
+            GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, 0)
+            self.pbo_index = 1 - self.pbo_index
+        else:
+            GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, 0, 0, w, h, GL.GL_BGR, GL.GL_UNSIGNED_BYTE, frame)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+
+    # FrameScheduler view interface
+    def video_due_at(self, now):
+        """Monotonic time the next buffered frame is due, a poll time while buffering, or None."""
+        if self.frames is None:
+            return None
+        pts = self.frames.peek_pts()
+        if pts is None:
+            if self.decoder is None or not self.decoder.is_alive():
+                return None  # the decoder gave up (open failed, no frames, download failed), nothing more is coming
+            return now + 0.05  # decoder is still filling the buffer
+        return self.play_start + pts
+
+    def rotation_due_at(self):
+        if not self.auto_rotate or self.dragging:
+            return None
+        return self.rotate_clock + 1.0 / ROTATION_FPS
+
+    def next_deadline(self, now):
+        deadlines = [d for d in (self.video_due_at(now), self.rotation_due_at()) if d is not None]
+        return min(deadlines) if deadlines else None
+
+    def tick(self, now):
+        dirty = False
+        rotate_at = self.rotation_due_at()
+        if rotate_at is not None and rotate_at <= now:
+            self.angle_y = (self.angle_y + ROTATE_DEG_PER_S * (now - self.rotate_clock)) % 360
+            self.rotate_clock = now
+            dirty = True
+        if self.frames is not None:
+            pts = self.frames.peek_pts()
+            if pts is not None and self.play_start + pts <= now:
+                dirty = True
+        if self.source is not None and not self.first_frame_shown:
+            self.show_progress_text()
+            fraction = self.source.fraction()
+            if fraction is not None and int(round(fraction * 64)) != self.progress_shown:
+                dirty = True
+        if dirty:
+            self.update()
+
+    def resume(self, now):
+        # don't spin the globe forward by however long we were minimized
+        self.rotate_clock = now
 
     # Interaction: drag to rotate, wheel to zoom
     def mousePressEvent(self, event):
@@ -468,6 +1559,8 @@ class VideoTextureGlobe(QOpenGLWidget):
             self.dragging = False
             self.auto_rotate = True
             self.last_pos = None
+            self.rotate_clock = time.monotonic()
+            self.scheduler.wake()
 
     def wheelEvent(self, event):
         delta = event.angleDelta().y() / 120.0
@@ -476,18 +1569,15 @@ class VideoTextureGlobe(QOpenGLWidget):
         self.update()
 
     def close(self):
-        if self.cap:
-            try:
-                self.cap.release()
-            except:
-                pass
-            self.cap = None
+        self.stop_video()
         super().close()
 
 # ----------------------------
 # Main App (layout + logic)
 # ----------------------------
 class DisasterApp(QWidget):
+    catalog_loaded = pyqtSignal(object)  # emitted from a loader thread, delivered on the GUI thread
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Video-on-Globe Disaster Viewer")
@@ -518,15 +1608,21 @@ class DisasterApp(QWidget):
         # left slideshow
         self.left_label = QLabel("Left Slideshow")
         self.left_label.setAlignment(Qt.AlignCenter)
+        # size comes from the layout, not the pixmap (frames are scaled to the label)
+        self.left_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         middle_layout.addWidget(self.left_label, 1)
 
+        # one scheduler drives the globe and both slideshows
+        self.scheduler = FrameScheduler(self)
+
         # center globe (video-textured)
-        self.globe_widget = VideoTextureGlobe()
+        self.globe_widget = VideoTextureGlobe(scheduler=self.scheduler)
         middle_layout.addWidget(self.globe_widget, 1)
 
         # right slideshow
         self.right_label = QLabel("Right Slideshow")
         self.right_label.setAlignment(Qt.AlignCenter)
+        self.right_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         middle_layout.addWidget(self.right_label, 1)
 
         self.layout.addLayout(middle_layout, 4)
@@ -537,21 +1633,44 @@ class DisasterApp(QWidget):
         self.text_area.setStyleSheet("background-color:#111; color:white; font-size:15px;")
         self.layout.addWidget(self.text_area, 2)
 
-        # timers and lists for slideshows
-        self.left_images = []
+        # timers and pre-scaled frames for slideshows
+        self.left_slides = SlideshowCache(self.left_label, self)
+        self.left_slides.frame_added.connect(self.on_left_frame_added)
         self.left_index = 0
-        self.left_timer = QTimer()
-        self.left_timer.timeout.connect(self.next_left_image)
-        self.left_timer.setInterval(500)
+        self.left_timer = self.scheduler.task(500, self.next_left_image)
 
-        self.right_images = []
+        self.right_slides = SlideshowCache(self.right_label, self)
+        self.right_slides.frame_added.connect(self.on_right_frame_added)
         self.right_index = 0
-        self.right_timer = QTimer()
-        self.right_timer.timeout.connect(self.next_right_image)
-        self.right_timer.setInterval(2000)
+        self.right_timer = self.scheduler.task(2000, self.next_right_image)
+
+        # assets of the selected incident are fetched in the background
+        self.loader = None
 
-        # Keep track of downloaded files to optionally clean up
-        self.downloaded_files = []
+        # the catalog shown is the cached one; fetch the current one behind it
+        self.catalog_loaded.connect(self.on_catalog_loaded)
+        if REMOTE_EVENTS_URL:
+            loader_pool.submit(lambda: self.catalog_loaded.emit(fetch_remote_catalog(REMOTE_EVENTS_URL)))
+
+    def on_catalog_loaded(self, catalog):
+        """Swap in a freshly downloaded catalog, keeping the current selection if it is still there."""
+        global disasters
+        startup_mark("remote catalog " + ("unchanged" if catalog == disasters else "failed" if catalog is None else "loaded"))
+        if catalog is None or catalog == disasters:
+            return
+        dtype = self.disaster_dropdown.currentText()
+        incident = self.incident_dropdown.currentText()
+        disasters = catalog
+        self.disaster_dropdown.blockSignals(True)
+        self.disaster_dropdown.clear()
+        self.disaster_dropdown.addItems(disasters.keys())
+        if dtype in disasters:
+            self.disaster_dropdown.setCurrentText(dtype)
+        self.disaster_dropdown.blockSignals(False)
+        self.update_incidents(self.disaster_dropdown.currentText())
+        idx = self.incident_dropdown.findText(incident)
+        if idx >= 0:
+            self.incident_dropdown.setCurrentIndex(idx)
 
     def update_incidents(self, disaster_type):
         incidents = disasters.get(disaster_type, [])
@@ -569,88 +1688,88 @@ class DisasterApp(QWidget):
             return
         incident = disasters[dtype][idx]
 
-        # 1) download and set globe video
-        video_url = incident.get("video")
-        if video_url:
-            out_video = "incident_globe.mp4"
-            ok = download_file(drive_to_direct(video_url), out_video)
-            if ok and os.path.exists(out_video):
-                # store for cleanup
-                if out_video not in self.downloaded_files:
-                    self.downloaded_files.append(out_video)
-                self.globe_widget.set_video(out_video)
-            else:
-                self.text_area.setPlainText("Failed to download globe video.")
-        else:
-            self.text_area.setPlainText("No video provided for this incident.")
+        # cancel whatever the previous incident was still fetching
+        if self.loader is not None:
+            self.loader.cancel()
 
-        # 2) download and set description
         self.text_area.setPlainText("Loading description...")
-        text_url = incident.get("text")
-        desc = "No description available."
-        if text_url:
-            out_txt = "incident_desc.txt"
-            ok = download_file(drive_to_direct(text_url), out_txt)
-            if ok and os.path.exists(out_txt):
-                try:
-                    with open(out_txt, "r", encoding="utf-8") as f:
-                        desc = f.read()
-                except Exception as e:
-                    desc = f"Error reading description: {e}"
-                if out_txt not in self.downloaded_files:
-                    self.downloaded_files.append(out_txt)
-            else:
-                desc = "Failed to download description."
+        self.left_timer.stop()
+        self.left_slides.clear()
+        self.left_index = 0
+        self.right_timer.stop()
+        self.right_slides.clear()
+        self.right_index = 0
+
+        # no Qt parent: the loader is freed once its last worker job lets go of it
+        self.loader = IncidentLoader(incident)
+        self.loader.text_ready.connect(self.on_text_ready)
+        self.loader.left_image_ready.connect(self.on_left_image)
+        self.loader.right_image_ready.connect(self.on_right_image)
+        self.loader.video_streaming.connect(self.on_video_streaming)
+        self.loader.video_ready.connect(self.on_video_ready)
+        self.loader.failed.connect(self.on_load_failed)
+        self.loader.start()
+
+    # Loader slots: ignore anything still arriving from a cancelled incident
+    def on_text_ready(self, desc):
+        if self.sender() is not self.loader:
+            return
         self.text_area.setPlainText(desc)
         self.highlight_text()
 
-        # 3) left slideshow (0.5s)
-        self.left_timer.stop()
-        self.left_images.clear()
-        self.left_index = 0
-        for i, url in enumerate(incident.get("slideshow", [])):
-            out = f"left_{i}.jpg"
-            if download_file(drive_to_direct(url), out):
-                pix = QPixmap(out)
-                if not pix.isNull():
-                    self.left_images.append(pix)
-                    if out not in self.downloaded_files:
-                        self.downloaded_files.append(out)
-        if self.left_images:
+    def on_video_streaming(self, stream):
+        if self.sender() is not self.loader:
+            return
+        self.globe_widget.set_video(stream.path, source=stream)
+
+    def on_video_ready(self, path):
+        if self.sender() is not self.loader:
+            return
+        source = self.globe_widget.source
+        if source is not None and source.complete and source.path == path:
+            return  # already playing it from the stream
+        self.globe_widget.set_video(path)
+
+    def on_load_failed(self, message):
+        if self.sender() is not self.loader:
+            return
+        print(message)
+        self.text_area.append(message)
+
+    def on_left_image(self, index, path):
+        if self.sender() is not self.loader:
+            return
+        self.left_slides.add(index, path)
+
+    def on_right_image(self, index, path):
+        if self.sender() is not self.loader:
+            return
+        self.right_slides.add(index, path)
+
+    def on_left_frame_added(self):
+        if not self.left_timer.isActive():
+            # show the first frame right away instead of waiting a tick
+            self.next_left_image()
             self.left_timer.start()
 
-        # 4) right slideshow (2s)
-        self.right_timer.stop()
-        self.right_images.clear()
-        self.right_index = 0
-        for i, url in enumerate(incident.get("right_images", [])):
-            out = f"right_{i}.jpg"
-            if download_file(drive_to_direct(url), out):
-                pix = QPixmap(out)
-                if not pix.isNull():
-                    self.right_images.append(pix)
-                    if out not in self.downloaded_files:
-                        self.downloaded_files.append(out)
-        if self.right_images:
+    def on_right_frame_added(self):
+        if not self.right_timer.isActive():
+            self.next_right_image()
             self.right_timer.start()
 
     def next_left_image(self):
-        if not self.left_images:
+        if not len(self.left_slides):
             return
-        pix = self.left_images[self.left_index]
-        self.left_label.setPixmap(pix.scaled(
-            self.left_label.width(), self.left_label.height(),
-            Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        self.left_index = (self.left_index + 1) % len(self.left_images)
+        self.left_index %= len(self.left_slides)
+        self.left_label.setPixmap(self.left_slides.pixmap(self.left_index))
+        self.left_index = (self.left_index + 1) % len(self.left_slides)
 
     def next_right_image(self):
-        if not self.right_images:
+        if not len(self.right_slides):
             return
-        pix = self.right_images[self.right_index]
-        self.right_label.setPixmap(pix.scaled(
-            self.right_label.width(), self.right_label.height(),
-            Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        self.right_index = (self.right_index + 1) % len(self.right_images)
+        self.right_index %= len(self.right_slides)
+        self.right_label.setPixmap(self.right_slides.pixmap(self.right_index))
+        self.right_index = (self.right_index + 1) % len(self.right_slides)
 
     def highlight_text(self):
         cursor = self.text_area.textCursor()
@@ -682,19 +1801,179 @@ class DisasterApp(QWidget):
             cursor.mergeCharFormat(fmt_n)
 
     def closeEvent(self, event):
-        # Clean up downloaded files if you want (uncomment to remove):
-        # for f in self.downloaded_files:
-        #     try: os.remove(f)
-        #     except: pass
+        # Downloaded assets live in the persistent asset cache (ASSET_CACHE_DIR)
+        # and are reused on the next run, so there is nothing to clean up here.
+        if self.loader is not None:
+            self.loader.cancel()
+        loader_pool.shutdown(wait=False, cancel_futures=True)
         super().closeEvent(event)
 
+# ----------------------------
+# Benchmarks (python "Visualizer (Forest Fire).py" --bench [video.mp4])
+# ----------------------------
+BENCH_DIR = os.environ.get("TERRA_BENCH_DIR", "bench_results")
+BENCH_TOLERANCE = 0.20  # same rule as the notebook's benchmark cell
+BENCH_MIN_DELTA_MS = 1.0
+
+def bench_stats(latencies, wall):
+    ms = np.array(latencies) * 1000 if latencies else np.array([np.nan])
+    return {"n": len(latencies), "errors": 0, "throughput_per_s": len(latencies) / wall if wall else 0.0,
+            "p50_ms": float(np.percentile(ms, 50)), "p95_ms": float(np.percentile(ms, 95)),
+            "p99_ms": float(np.percentile(ms, 99)), "peak_rss_mb": bench_peak_rss_mb()}
+
+def bench_peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+def bench_video(path, frames=120, size=(1280, 640), fps=30):
+    """Write a synthetic test video, so the benchmark needs nothing downloaded."""
+    import cv2
+    w, h = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    rng = np.random.RandomState(0)
+    base = cv2.resize(rng.randint(0, 256, (h // 16, w // 16, 3), dtype=np.uint8), size,
+                      interpolation=cv2.INTER_NEAREST)
+    for i in range(frames):
+        writer.write(np.roll(base, i * 8, axis=1))
+    writer.release()
+    return path
+
+def bench_decode(path, frames=120):
+    """Frames/s a VideoDecoder delivers into its ring buffer when nobody waits for presentation times."""
+    ring = FrameRingBuffer()
+    decoder = VideoDecoder(path, ring)
+    latencies = []
+    start = last = time.perf_counter()
+    decoder.start()
+    while len(latencies) < frames and decoder.is_alive():
+        pts = ring.peek_pts()
+        if pts is None:
+            time.sleep(0.0005)
+            continue
+        ring.take_latest(pts)
+        now = time.perf_counter()
+        latencies.append(now - last)
+        last = now
+    decoder.stop()
+    return bench_stats(latencies, time.perf_counter() - start)
+
+def bench_thumbnails(jpeg_path, iterations=50, size=(480, 270)):
+    """The slideshow's scaled JPEG decode (SlideshowCache._scale without the signal)."""
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t = time.perf_counter()
+        reader = QImageReader(jpeg_path)
+        reader.setScaledSize(reader.size().scaled(size[0], size[1], Qt.KeepAspectRatio))
+        if reader.read().isNull():
+            raise RuntimeError(reader.errorString())
+        latencies.append(time.perf_counter() - t)
+    return bench_stats(latencies, time.perf_counter() - start)
+
+def bench_upload(path, frames=120):
+    """Texture streaming through VideoTextureGlobe.upload_frame; None without a usable GL context."""
+    import cv2
+    cap = cv2.VideoCapture(path)
+    decoded = []
+    while len(decoded) < frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        decoded.append(frame)
+    cap.release()
+    globe = VideoTextureGlobe()
+    globe.resize(64, 64)
+    globe.show()
+    QApplication.processEvents()
+    if not globe.isValid() or not globe.tex_id:
+        globe.close()
+        return None
+    globe.makeCurrent()
+    latencies = []
+    start = time.perf_counter()
+    for frame in decoded:
+        t = time.perf_counter()
+        globe.upload_frame(frame)
+        GL.glFinish()  # count the transfer, not just the queuing
+        latencies.append(time.perf_counter() - t)
+    wall = time.perf_counter() - start
+    globe.doneCurrent()
+    globe.close()
+    return bench_stats(latencies, wall)
+
+def run_bench(argv):
+    """Measure the frame pipeline, store the run under BENCH_DIR and flag regressions against the last one."""
+    import tempfile, cv2
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    tmp = tempfile.mkdtemp(prefix="terra-bench-")
+    try:
+        video = argv[0] if argv else bench_video(os.path.join(tmp, "bench.mp4"))
+        jpeg = os.path.join(tmp, "bench.jpg")
+        cap = cv2.VideoCapture(video)
+        ok, frame = cap.read()
+        cap.release()
+        if not ok:
+            print("Could not read benchmark video:", video)
+            return False
+        cv2.imwrite(jpeg, cv2.resize(frame, (1920, 1080)))
+        results = {}
+        results["decode -> ring buffer"] = bench_decode(video)
+        results["slideshow scaled decode"] = bench_thumbnails(jpeg)
+        upload = bench_upload(video)
+        if upload is None:
+            print("No OpenGL context here, skipping the texture upload benchmark")
+        else:
+            results["texture upload" + (" (PBO)" if TEXTURE_USE_PBO else "")] = upload
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(BENCH_DIR, f"visualizer-{stamp}.json")
+    previous = sorted(f for f in os.listdir(BENCH_DIR) if f.startswith("visualizer-") and f.endswith(".json"))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"suite": "visualizer", "created": stamp, "video": argv[0] if argv else "synthetic",
+                   "results": results}, f, indent=1)
+
+    baseline = {}
+    if previous:
+        with open(os.path.join(BENCH_DIR, previous[-1]), encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+    regressions = 0
+    print(f"{'case':28} {'n':>4} {'thr/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, r in results.items():
+        b = baseline.get(name)
+        worse = []
+        if b:
+            worse = [k for k in ("p50_ms", "p95_ms")
+                     if r[k] > b[k] * (1 + BENCH_TOLERANCE) and r[k] - b[k] >= BENCH_MIN_DELTA_MS]
+        regressions += bool(worse)
+        flag = f"  regressed: {', '.join(worse)}" if worse else ""
+        print(f"{name:28} {r['n']:>4} {r['throughput_per_s']:>8.1f} {r['p50_ms']:>8.1f} "
+              f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}{flag}")
+    print("Saved", path, f"({regressions} regressions vs {previous[-1]})" if previous else "(no baseline yet)")
+    return regressions == 0
+
 # ----------------------------
 # Run application
 # ----------------------------
 def main():
+    if sys.argv[1:2] == ["--bench"]:
+        sys.exit(0 if run_bench(sys.argv[2:]) else 1)
     app = QApplication(sys.argv)
+    startup_mark("QApplication")
     w = DisasterApp()
+    startup_mark("window built")
     w.show()
+    startup_mark("window shown")
+    QTimer.singleShot(0, lambda: startup_mark("event loop running"))
+    loader_pool.submit(warm_imports)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":